@@ -16,20 +16,39 @@
 See https://www.mediawiki.org/wiki/Wikibase/DataModel
 """
 
-import abc
 from collections.abc import Collection, Mapping, Sequence
 import dataclasses
 import datetime
-import re
-from typing import Any, Self
+import functools
+from typing import Any, cast, ClassVar, Self
+import weakref
 
 from dateutil import relativedelta
 
 
+def _is_id(value: str, *, letter: str) -> bool:
+    """Returns whether the value is a Wikidata ID starting with the letter."""
+    digits = value[1:]
+    return value[:1] == letter and digits.isascii() and digits.isdigit()
+
+
+def _invalid_id_error(
+    value: str,
+    *,
+    prefixes: Sequence[str],
+    letter: str,
+) -> ValueError:
+    recognized_forms = [f"{prefix}{letter}123" for prefix in prefixes]
+    return ValueError(
+        f"Wikidata IRI or ID {value!r} is not in one of the recognized "
+        f"forms: {recognized_forms}"
+    )
+
+
 def _parse_id(
     value: str,
     *,
-    prefixes: Collection[str] = ("",),
+    prefixes: Sequence[str] = ("",),
     letter: str,
 ) -> str:
     """Returns a parsed Wikidata ID.
@@ -37,65 +56,75 @@ def _parse_id(
     Args:
         value: String to parse.
         prefixes: Valid prefixes before the ID, e.g.,
-            "https://www.wikidata.org/wiki/" for an item.
+            "https://www.wikidata.org/wiki/" for an item. Only the first prefix
+            that the value starts with is tried, so longer prefixes must come
+            before any shorter prefixes of them, e.g., "" must be last.
         letter: Which letter the ID starts with, e.g., "Q" for an item.
     """
-    match = re.fullmatch(
-        r"(?P<prefix>.*)(?P<id>(?P<letter>[A-Z])[0-9]+)", value
-    )
-    if (
-        match is None
-        or match.group("prefix") not in prefixes
-        or match.group("letter") != letter
-    ):
-        recognized_forms = [f"{prefix}{letter}123" for prefix in prefixes]
-        raise ValueError(
-            f"Wikidata IRI or ID {value!r} is not in one of the recognized "
-            f"forms: {recognized_forms}"
-        )
-    return match.group("id")
+    for prefix in prefixes:
+        if value.startswith(prefix):
+            id_ = value[len(prefix) :]
+            if _is_id(id_, letter=letter):
+                return id_
+            break
+    raise _invalid_id_error(value, prefixes=prefixes, letter=letter)
 
 
 _ENTITY_PREFIX_CANONICAL_URI = "http://www.wikidata.org/entity/"
 
 
-@dataclasses.dataclass(frozen=True)
-class EntityRef(abc.ABC):
+@dataclasses.dataclass(frozen=True, slots=True, weakref_slot=True)
+class EntityRef:
     """Reference (ID/URI) to a Wikidata entity.
 
+    Refs are interned: constructing a ref with the same class and ID as an
+    existing one returns the existing instance, without validating the ID again.
+
     Attributes:
+        LETTER: Which letter the ID starts with, e.g., "Q" for an item. Set by
+            each subclass.
+        HUMAN_READABLE_URL_PREFIX: The prefix before the ID for a
+            human-readable URL. Set by each subclass.
         id: ID of the entity, e.g., "Q3107329" for an item or "P580" for a
             property.
     """
 
-    id: str
+    LETTER: ClassVar[str]
+    HUMAN_READABLE_URL_PREFIX: ClassVar[str]
 
-    @classmethod
-    @abc.abstractmethod
-    def letter(cls) -> str:
-        """Returns which letter the ID starts with, e.g., "Q" for an item."""
-        raise NotImplementedError()
+    _interned: ClassVar[
+        weakref.WeakValueDictionary[tuple[type["EntityRef"], str], "EntityRef"]
+    ] = weakref.WeakValueDictionary()
 
-    @classmethod
-    @abc.abstractmethod
-    def human_readable_url_prefix(cls) -> str:
-        """Returns the prefix before the ID for a human-readable URL."""
-        raise NotImplementedError()
+    id: str
 
-    def __post_init__(self) -> None:
-        _parse_id(self.id, letter=self.letter())  # Validate the ID.
+    def __new__(cls, id: str) -> Self:  # pylint: disable=redefined-builtin
+        key = (cls, id)
+        ref = cls._interned.get(key)
+        if ref is None:
+            if not _is_id(id, letter=cls.LETTER):
+                raise _invalid_id_error(id, prefixes=("",), letter=cls.LETTER)
+            ref = object.__new__(cls)
+            cls._interned[key] = ref
+        return cast(Self, ref)
+
+    def __reduce__(self) -> tuple[type[Self], tuple[str]]:
+        # Reconstruct only through __new__ so that copying or unpickling never
+        # writes state into the shared interned instance.
+        return (type(self), (self.id,))
 
     def __str__(self) -> str:
-        return f"{self.human_readable_url_prefix()}{self.id}"
+        return f"{self.HUMAN_READABLE_URL_PREFIX}{self.id}"
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def from_string(cls, value: str) -> Self:
         """Returns the entity ref parsed from a string."""
         return cls(
             _parse_id(
                 value,
-                prefixes=("", cls.human_readable_url_prefix()),
-                letter=cls.letter(),
+                prefixes=(cls.HUMAN_READABLE_URL_PREFIX, ""),
+                letter=cls.LETTER,
             )
         )
 
@@ -109,13 +138,14 @@ class EntityRef(abc.ABC):
         return f"{_ENTITY_PREFIX_CANONICAL_URI}{self.id}"
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def from_uri(cls, value: str) -> Self:
         """Returns the entity ref parsed from its canonical URI."""
         return cls(
             _parse_id(
                 value,
                 prefixes=(_ENTITY_PREFIX_CANONICAL_URI,),
-                letter=cls.letter(),
+                letter=cls.LETTER,
             )
         )
 
@@ -123,102 +153,80 @@ class EntityRef(abc.ABC):
 class ItemRef(EntityRef):
     """Reference (ID/URI) to a Wikidata item."""
 
-    @classmethod
-    def letter(cls) -> str:
-        """See base class."""
-        return "Q"
-
-    @classmethod
-    def human_readable_url_prefix(cls) -> str:
-        """See base class."""
-        return "https://www.wikidata.org/wiki/"
-
-
-_i = ItemRef.from_string
-Q_ANTHOLOGY = _i("https://www.wikidata.org/wiki/Q105420")
-Q_ANTHOLOGY_FILM = _i("https://www.wikidata.org/wiki/Q336144")
-Q_BOX_OFFICE = _i("https://www.wikidata.org/wiki/Q21707777")
-Q_CLASS_OF_FICTIONAL_ENTITIES = _i("https://www.wikidata.org/wiki/Q15831596")
-Q_COLLECTION_OF_LITERARY_WORKS = _i("https://www.wikidata.org/wiki/Q108329152")
-Q_FICTIONAL_ENTITY = _i("https://www.wikidata.org/wiki/Q14897293")
-Q_FICTIONAL_UNIVERSE = _i("https://www.wikidata.org/wiki/Q559618")
-Q_FILM = _i("https://www.wikidata.org/wiki/Q11424")
-Q_GREGORIAN_CALENDAR = _i("https://www.wikidata.org/wiki/Q12138")
-Q_LIST = _i("https://www.wikidata.org/wiki/Q12139612")
-Q_LITERARY_WORK = _i("https://www.wikidata.org/wiki/Q7725634")
-Q_MUSICAL_WORK = _i("https://www.wikidata.org/wiki/Q2188189")
-Q_NOVELLA = _i("https://www.wikidata.org/wiki/Q149537")
-Q_OMNIVERSE = _i("https://www.wikidata.org/wiki/Q116503898")
-Q_PARATEXT = _i("https://www.wikidata.org/wiki/Q853520")
-Q_PART_OF_TELEVISION_SEASON = _i("https://www.wikidata.org/wiki/Q93992677")
-Q_PLACEHOLDER_NAME = _i("https://www.wikidata.org/wiki/Q1318274")
-Q_PROLEPTIC_GREGORIAN_CALENDAR = _i("https://www.wikidata.org/wiki/Q1985727")
-Q_RELEASE_GROUP = _i("https://www.wikidata.org/wiki/Q108346082")
-Q_SEGMENT_OF_A_TELEVISION_EPISODE = _i(
-    "https://www.wikidata.org/wiki/Q29555881"
-)
-Q_SHORT_STORY = _i("https://www.wikidata.org/wiki/Q49084")
-Q_TELEVISION_FILM = _i("https://www.wikidata.org/wiki/Q506240")
-Q_TELEVISION_PILOT = _i("https://www.wikidata.org/wiki/Q653916")
-Q_TELEVISION_SERIES = _i("https://www.wikidata.org/wiki/Q5398426")
-Q_TELEVISION_SERIES_EPISODE = _i("https://www.wikidata.org/wiki/Q21191270")
-Q_TELEVISION_SERIES_SEASON = _i("https://www.wikidata.org/wiki/Q3464665")
-Q_TELEVISION_SPECIAL = _i("https://www.wikidata.org/wiki/Q1261214")
-Q_TOMMY_WESTPHALL_UNIVERSE = _i("https://www.wikidata.org/wiki/Q95410310")
-Q_WEB_SERIES = _i("https://www.wikidata.org/wiki/Q526877")
-Q_WEB_SERIES_EPISODE = _i("https://www.wikidata.org/wiki/Q1464125")
-Q_WEB_SERIES_SEASON = _i("https://www.wikidata.org/wiki/Q61704031")
-Q_WIKIMEDIA_PAGE_OUTSIDE_THE_MAIN_KNOWLEDGE_TREE = _i(
-    "https://www.wikidata.org/wiki/Q17379835"
-)
-del _i
+    __slots__ = ()
+
+    LETTER = "Q"
+    HUMAN_READABLE_URL_PREFIX = "https://www.wikidata.org/wiki/"
+
+
+Q_ANTHOLOGY = ItemRef("Q105420")
+Q_ANTHOLOGY_FILM = ItemRef("Q336144")
+Q_BOX_OFFICE = ItemRef("Q21707777")
+Q_CLASS_OF_FICTIONAL_ENTITIES = ItemRef("Q15831596")
+Q_COLLECTION_OF_LITERARY_WORKS = ItemRef("Q108329152")
+Q_FICTIONAL_ENTITY = ItemRef("Q14897293")
+Q_FICTIONAL_UNIVERSE = ItemRef("Q559618")
+Q_FILM = ItemRef("Q11424")
+Q_GREGORIAN_CALENDAR = ItemRef("Q12138")
+Q_LIST = ItemRef("Q12139612")
+Q_LITERARY_WORK = ItemRef("Q7725634")
+Q_MUSICAL_WORK = ItemRef("Q2188189")
+Q_NOVELLA = ItemRef("Q149537")
+Q_OMNIVERSE = ItemRef("Q116503898")
+Q_PARATEXT = ItemRef("Q853520")
+Q_PART_OF_TELEVISION_SEASON = ItemRef("Q93992677")
+Q_PLACEHOLDER_NAME = ItemRef("Q1318274")
+Q_PROLEPTIC_GREGORIAN_CALENDAR = ItemRef("Q1985727")
+Q_RELEASE_GROUP = ItemRef("Q108346082")
+Q_SEGMENT_OF_A_TELEVISION_EPISODE = ItemRef("Q29555881")
+Q_SHORT_STORY = ItemRef("Q49084")
+Q_TELEVISION_FILM = ItemRef("Q506240")
+Q_TELEVISION_PILOT = ItemRef("Q653916")
+Q_TELEVISION_SERIES = ItemRef("Q5398426")
+Q_TELEVISION_SERIES_EPISODE = ItemRef("Q21191270")
+Q_TELEVISION_SERIES_SEASON = ItemRef("Q3464665")
+Q_TELEVISION_SPECIAL = ItemRef("Q1261214")
+Q_TOMMY_WESTPHALL_UNIVERSE = ItemRef("Q95410310")
+Q_WEB_SERIES = ItemRef("Q526877")
+Q_WEB_SERIES_EPISODE = ItemRef("Q1464125")
+Q_WEB_SERIES_SEASON = ItemRef("Q61704031")
+Q_WIKIMEDIA_PAGE_OUTSIDE_THE_MAIN_KNOWLEDGE_TREE = ItemRef("Q17379835")
 
 
 class PropertyRef(EntityRef):
     """Reference (ID/URI) to a Wikidata property."""
 
-    @classmethod
-    def letter(cls) -> str:
-        """See base class."""
-        return "P"
-
-    @classmethod
-    def human_readable_url_prefix(cls) -> str:
-        """See base class."""
-        return "https://www.wikidata.org/wiki/Property:"
-
-
-_p = PropertyRef.from_string
-P_BASED_ON = _p("https://www.wikidata.org/wiki/Property:P144")
-P_DATE_OF_FIRST_PERFORMANCE = _p("https://www.wikidata.org/wiki/Property:P1191")
-P_DERIVATIVE_WORK = _p("https://www.wikidata.org/wiki/Property:P4969")
-P_END_TIME = _p("https://www.wikidata.org/wiki/Property:P582")
-P_FICTIONAL_UNIVERSE_DESCRIBED_IN = _p(
-    "https://www.wikidata.org/wiki/Property:P1445"
-)
-P_FOLLOWED_BY = _p("https://www.wikidata.org/wiki/Property:P156")
-P_FOLLOWS = _p("https://www.wikidata.org/wiki/Property:P155")
-P_FORM_OF_CREATIVE_WORK = _p("https://www.wikidata.org/wiki/Property:P7937")
-P_HAS_PARTS = _p("https://www.wikidata.org/wiki/Property:P527")
-P_HAS_SPIN_OFF = _p("https://www.wikidata.org/wiki/Property:P2512")
-P_INSTANCE_OF = _p("https://www.wikidata.org/wiki/Property:P31")
-P_MANIFESTATION_OF = _p("https://www.wikidata.org/wiki/Property:P1557")
-P_MEDIA_FRANCHISE = _p("https://www.wikidata.org/wiki/Property:P8345")
-P_MODIFIED_VERSION_OF = _p("https://www.wikidata.org/wiki/Property:P5059")
-P_PART_OF = _p("https://www.wikidata.org/wiki/Property:P361")
-P_PART_OF_THE_SERIES = _p("https://www.wikidata.org/wiki/Property:P179")
-P_PLACE_OF_PUBLICATION = _p("https://www.wikidata.org/wiki/Property:P291")
-P_PLOT_EXPANDED_IN = _p("https://www.wikidata.org/wiki/Property:P5940")
-P_PUBLICATION_DATE = _p("https://www.wikidata.org/wiki/Property:P577")
-P_SEASON = _p("https://www.wikidata.org/wiki/Property:P4908")
-P_SERIES_ORDINAL = _p("https://www.wikidata.org/wiki/Property:P1545")
-P_START_TIME = _p("https://www.wikidata.org/wiki/Property:P580")
-P_SUBCLASS_OF = _p("https://www.wikidata.org/wiki/Property:P279")
-P_SUPPLEMENT_TO = _p("https://www.wikidata.org/wiki/Property:P9234")
-P_TAKES_PLACE_IN_FICTIONAL_UNIVERSE = _p(
-    "https://www.wikidata.org/wiki/Property:P1434"
-)
-del _p
+    __slots__ = ()
+
+    LETTER = "P"
+    HUMAN_READABLE_URL_PREFIX = "https://www.wikidata.org/wiki/Property:"
+
+
+P_BASED_ON = PropertyRef("P144")
+P_DATE_OF_FIRST_PERFORMANCE = PropertyRef("P1191")
+P_DERIVATIVE_WORK = PropertyRef("P4969")
+P_END_TIME = PropertyRef("P582")
+P_FICTIONAL_UNIVERSE_DESCRIBED_IN = PropertyRef("P1445")
+P_FOLLOWED_BY = PropertyRef("P156")
+P_FOLLOWS = PropertyRef("P155")
+P_FORM_OF_CREATIVE_WORK = PropertyRef("P7937")
+P_HAS_PARTS = PropertyRef("P527")
+P_HAS_SPIN_OFF = PropertyRef("P2512")
+P_INSTANCE_OF = PropertyRef("P31")
+P_MANIFESTATION_OF = PropertyRef("P1557")
+P_MEDIA_FRANCHISE = PropertyRef("P8345")
+P_MODIFIED_VERSION_OF = PropertyRef("P5059")
+P_PART_OF = PropertyRef("P361")
+P_PART_OF_THE_SERIES = PropertyRef("P179")
+P_PLACE_OF_PUBLICATION = PropertyRef("P291")
+P_PLOT_EXPANDED_IN = PropertyRef("P5940")
+P_PUBLICATION_DATE = PropertyRef("P577")
+P_SEASON = PropertyRef("P4908")
+P_SERIES_ORDINAL = PropertyRef("P1545")
+P_START_TIME = PropertyRef("P580")
+P_SUBCLASS_OF = PropertyRef("P279")
+P_SUPPLEMENT_TO = PropertyRef("P9234")
+P_TAKES_PLACE_IN_FICTIONAL_UNIVERSE = PropertyRef("P1434")
 
 
 def _language_keyed_string(
@@ -226,16 +234,48 @@ def _language_keyed_string(
     languages: Sequence[str],
 ) -> str | None:
     # https://doc.wikimedia.org/Wikibase/master/php/docs_topics_json.html#json_fingerprint
+    # For each prefix of a language that ends right before a "-", the first
+    # record in a language with that prefix. E.g., "en" for "en-us". This is
+    # only built if an exact match fails.
+    records_by_language_prefix: dict[str, Any] | None = None
     for language in languages:
         if language in mapping:
             return mapping[language]["value"]
-        for other_language, record in mapping.items():
-            if other_language.startswith(f"{language}-"):
-                return record["value"]
+        if records_by_language_prefix is None:
+            records_by_language_prefix = {}
+            for other_language, record in mapping.items():
+                prefix_end = other_language.find("-")
+                while prefix_end != -1:
+                    records_by_language_prefix.setdefault(
+                        other_language[:prefix_end], record
+                    )
+                    prefix_end = other_language.find("-", prefix_end + 1)
+        if language in records_by_language_prefix:
+            return records_by_language_prefix[language]["value"]
     return None
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+_GREGORIAN_CALENDAR_URIS = frozenset(
+    (
+        Q_GREGORIAN_CALENDAR.uri,
+        Q_PROLEPTIC_GREGORIAN_CALENDAR.uri,
+    )
+)
+
+# Calendar-based precisions need relativedelta to handle varying lengths of
+# months and years, but fixed-length precisions can use the faster timedelta.
+_TIME_PRECISION_TO_DELTA: Mapping[
+    int, relativedelta.relativedelta | datetime.timedelta
+] = {
+    7: relativedelta.relativedelta(years=100),
+    8: relativedelta.relativedelta(years=10),
+    9: relativedelta.relativedelta(years=1),
+    10: relativedelta.relativedelta(months=1),
+    11: datetime.timedelta(days=1),
+}
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Snak:
     """Snak.
 
@@ -246,83 +286,105 @@ class Snak:
 
     json: Any
 
-    def item_value(self) -> ItemRef:
-        """Returns the snak's item value."""
+    def _datavalue_value(
+        self,
+        *,
+        kind: str,
+        kind_with_article: str,
+        datatype: str,
+        datavalue_type: str,
+    ) -> Any:
+        """Returns the value of the snak's datavalue, after checking its type.
+
+        Args:
+            kind: Kind of value to parse, e.g., "item".
+            kind_with_article: Kind of value with an article, e.g., "an item".
+            datatype: Expected datatype of the snak.
+            datavalue_type: Expected type of the snak's datavalue.
+        """
         if self.json["snaktype"] != "value":
             raise NotImplementedError(
-                f"Cannot parse non-value snak as an item: {self.json}"
+                f"Cannot parse non-value snak as {kind_with_article}: "
+                f"{self.json}"
             )
-        if (
-            self.json["datatype"] != "wikibase-item"
-            or self.json["datavalue"]["type"] != "wikibase-entityid"
-            or self.json["datavalue"]["value"]["entity-type"] != "item"
-        ):
+        if self.json["datatype"] != datatype:
+            raise ValueError(
+                f"Cannot parse non-{kind} snak as {kind_with_article}: "
+                f"{self.json}"
+            )
+        datavalue = self.json["datavalue"]
+        if datavalue["type"] != datavalue_type:
+            raise ValueError(
+                f"Cannot parse non-{kind} snak as {kind_with_article}: "
+                f"{self.json}"
+            )
+        return datavalue["value"]
+
+    def item_value(self) -> ItemRef:
+        """Returns the snak's item value."""
+        value = self._datavalue_value(
+            kind="item",
+            kind_with_article="an item",
+            datatype="wikibase-item",
+            datavalue_type="wikibase-entityid",
+        )
+        if value["entity-type"] != "item":
             raise ValueError(
                 f"Cannot parse non-item snak as an item: {self.json}"
             )
-        return ItemRef(self.json["datavalue"]["value"]["id"])
+        return ItemRef(value["id"])
 
     def string_value(self) -> str:
         """Returns the snak's string value."""
-        if self.json["snaktype"] != "value":
-            raise NotImplementedError(
-                f"Cannot parse non-value snak as a string: {self.json}"
-            )
-        if (
-            self.json["datatype"] != "string"
-            or self.json["datavalue"]["type"] != "string"
-        ):
-            raise ValueError(
-                f"Cannot parse non-string snak as a string: {self.json}"
-            )
-        return self.json["datavalue"]["value"]
+        return self._datavalue_value(
+            kind="string",
+            kind_with_article="a string",
+            datatype="string",
+            datavalue_type="string",
+        )
 
     def time_value(self) -> tuple[datetime.datetime, datetime.datetime]:
         """Returns (earliest possible time, latest possible time)."""
-        if self.json["snaktype"] != "value":
-            raise NotImplementedError(
-                f"Cannot parse non-value snak as a time: {self.json}"
-            )
-        if (
-            self.json["datatype"] != "time"
-            or self.json["datavalue"]["type"] != "time"
-        ):
-            raise ValueError(
-                f"Cannot parse non-time snak as a time: {self.json}"
-            )
-        value = self.json["datavalue"]["value"]
-        if value["calendarmodel"] not in (
-            Q_GREGORIAN_CALENDAR.uri,
-            Q_PROLEPTIC_GREGORIAN_CALENDAR.uri,
-        ):
+        value = self._datavalue_value(
+            kind="time",
+            kind_with_article="a time",
+            datatype="time",
+            datavalue_type="time",
+        )
+        if value["calendarmodel"] not in _GREGORIAN_CALENDAR_URIS:
             raise NotImplementedError(
                 f"Cannot parse non-Gregorian time: {self.json}"
             )
         if value["timezone"] != 0:
             raise NotImplementedError(f"Cannot parse non-UTC time: {self.json}")
         try:
-            precision = {
-                7: relativedelta.relativedelta(years=100),
-                8: relativedelta.relativedelta(years=10),
-                9: relativedelta.relativedelta(years=1),
-                10: relativedelta.relativedelta(months=1),
-                11: relativedelta.relativedelta(days=1),
-            }[value["precision"]]
+            precision = _TIME_PRECISION_TO_DELTA[value["precision"]]
         except KeyError:
             raise NotImplementedError(
                 f"Cannot parse time's precision: {self.json}"
             ) from None
-        match = re.fullmatch(
-            (
-                r"\+([0-9]{4})-([0-9]{2})-([0-9]{2})"
-                r"T"
-                r"([0-9]{2}):([0-9]{2}):([0-9]{2})Z"
-            ),
-            value["time"],
+        # The time is always in the form +YYYY-MM-DDTHH:MM:SSZ.
+        time = value["time"]
+        fields = (
+            time[1:5],
+            time[6:8],
+            time[9:11],
+            time[12:14],
+            time[15:17],
+            time[18:20],
         )
-        if match is None:
+        if not (
+            len(time) == 21
+            and time.isascii()
+            and time[0] == "+"
+            and time[5] == time[8] == "-"
+            and time[11] == "T"
+            and time[14] == time[17] == ":"
+            and time[20] == "Z"
+            and "".join(fields).isdigit()
+        ):
             raise ValueError(f"Cannot parse time: {self.json}")
-        year, month, day, hour, minute, second = map(int, match.groups())
+        year, month, day, hour, minute, second = map(int, fields)
         base = datetime.datetime(
             year=year,
             month=month or 1,
@@ -342,7 +404,7 @@ class Snak:
         return earliest, latest
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Statement:
     """Statement.
 
@@ -400,7 +462,7 @@ class Statement:
                 )
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class Entity:
     """Data about an entity.
 
@@ -426,15 +488,16 @@ class Entity:
         self, property_ref: PropertyRef
     ) -> Collection[Statement]:
         # https://www.mediawiki.org/wiki/Wikibase/Indexing/RDF_Dump_Format#Truthy_statements
-        statements = self.json_full["claims"].get(property_ref.id, ())
+        preferred = []
+        normal = []
+        for statement in self.json_full["claims"].get(property_ref.id, ()):
+            match statement["rank"]:
+                case "preferred":
+                    preferred.append(statement)
+                case "normal":
+                    normal.append(statement)
         return tuple(
-            Statement(json=statement)
-            for statement in statements
-            if statement["rank"] == "preferred"
-        ) or tuple(
-            Statement(json=statement)
-            for statement in statements
-            if statement["rank"] == "normal"
+            Statement(json=statement) for statement in preferred or normal
         )
 
 
@@ -14,7 +14,9 @@
 
 # pylint: disable=missing-module-docstring
 
-from collections.abc import Callable, Collection, Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+import copy
+import pickle
 from typing import Any
 
 from absl.testing import absltest
@@ -30,6 +32,8 @@ _PRECISION_DAY = 11
 def _snak_time(
     time: str,
     *,
+    calendarmodel: str = wikidata_value.Q_PROLEPTIC_GREGORIAN_CALENDAR.uri,
+    timezone: int = 0,
     before: int = 0,
     after: int = 0,
     precision: int = _PRECISION_DAY,
@@ -40,10 +44,8 @@ def _snak_time(
         "datavalue": {
             "type": "time",
             "value": {
-                "calendarmodel": (
-                    wikidata_value.Q_PROLEPTIC_GREGORIAN_CALENDAR.uri
-                ),
-                "timezone": 0,
+                "calendarmodel": calendarmodel,
+                "timezone": timezone,
                 "before": before,
                 "after": after,
                 "precision": precision,
@@ -63,6 +65,45 @@ class WikidataValueTest(parameterized.TestCase):
         with self.assertRaisesRegex(ValueError, "Wikidata IRI or ID"):
             ref_cls("foo")
 
+    @parameterized.parameters("", "Q", "P1", "Q-1", "Q1.2", "Q²", "Q١", "q1")
+    def test_invalid_item_id(self, value: str) -> None:
+        with self.assertRaisesRegex(ValueError, "Wikidata IRI or ID"):
+            wikidata_value.ItemRef(value)
+
+    def test_entity_ref_interned(self) -> None:
+        self.assertIs(
+            wikidata_value.ItemRef("Q1"), wikidata_value.ItemRef("Q1")
+        )
+        self.assertIs(
+            wikidata_value.ItemRef("Q1"),
+            wikidata_value.ItemRef.from_string(
+                "https://www.wikidata.org/wiki/Q1"
+            ),
+        )
+
+    @parameterized.parameters(copy.copy, copy.deepcopy)
+    def test_entity_ref_copy(
+        self,
+        copy_function: Callable[
+            [wikidata_value.EntityRef], wikidata_value.EntityRef
+        ],
+    ) -> None:
+        ref = wikidata_value.ItemRef("Q1")
+        expected_hash = hash(ref)
+        ref_copy = copy_function(ref)
+        self.assertIs(ref, ref_copy)
+        self.assertEqual(expected_hash, hash(ref_copy))
+        self.assertEqual("http://www.wikidata.org/entity/Q1", ref_copy.uri)
+
+    @parameterized.parameters(range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_entity_ref_pickle(self, protocol: int) -> None:
+        ref = wikidata_value.PropertyRef("P1")
+        expected_hash = hash(ref)
+        unpickled = pickle.loads(pickle.dumps(ref, protocol=protocol))
+        self.assertIs(ref, unpickled)
+        self.assertEqual(expected_hash, hash(unpickled))
+        self.assertEqual("http://www.wikidata.org/entity/P1", unpickled.uri)
+
     @parameterized.parameters(
         (wikidata_value.ItemRef("Q1"), "https://www.wikidata.org/wiki/Q1"),
         (
@@ -128,13 +169,19 @@ class WikidataValueTest(parameterized.TestCase):
             ).id,
         )
 
+    @parameterized.parameters(
+        wikidata_value.Snak.item_value,
+        wikidata_value.Snak.string_value,
+        wikidata_value.Snak.time_value,
+    )
+    def test_snak_value_not_value(
+        self, function: Callable[[wikidata_value.Snak], Any]
+    ) -> None:
+        snak = wikidata_value.Snak(json={"snaktype": "somevalue"})
+        with self.assertRaisesRegex(NotImplementedError, r"non-value"):
+            function(snak)
+
     @parameterized.named_parameters(
-        dict(
-            testcase_name="not_value",
-            snak={"snaktype": "somevalue"},
-            error_class=NotImplementedError,
-            error_regex=r"non-value",
-        ),
         dict(
             testcase_name="datatype_not_item",
             snak={"snaktype": "value", "datatype": "string"},
@@ -172,8 +219,9 @@ class WikidataValueTest(parameterized.TestCase):
         error_class: type[Exception],
         error_regex: str,
     ) -> None:
+        parsed_snak = wikidata_value.Snak(json=snak)
         with self.assertRaisesRegex(error_class, error_regex):
-            wikidata_value.Snak(json=snak).item_value()
+            parsed_snak.item_value()
 
     def test_snak_item_value(self) -> None:
         self.assertEqual(
@@ -191,12 +239,6 @@ class WikidataValueTest(parameterized.TestCase):
         )
 
     @parameterized.named_parameters(
-        dict(
-            testcase_name="not_value",
-            snak={"snaktype": "somevalue"},
-            error_class=NotImplementedError,
-            error_regex=r"non-value",
-        ),
         dict(
             testcase_name="datatype_not_string",
             snak={"snaktype": "value", "datatype": "wikibase-item"},
@@ -221,8 +263,9 @@ class WikidataValueTest(parameterized.TestCase):
         error_class: type[Exception],
         error_regex: str,
     ) -> None:
+        parsed_snak = wikidata_value.Snak(json=snak)
         with self.assertRaisesRegex(error_class, error_regex):
-            wikidata_value.Snak(json=snak).string_value()
+            parsed_snak.string_value()
 
     def test_snak_string_value(self) -> None:
         self.assertEqual(
@@ -237,12 +280,6 @@ class WikidataValueTest(parameterized.TestCase):
         )
 
     @parameterized.named_parameters(
-        dict(
-            testcase_name="not_value",
-            snak={"snaktype": "somevalue"},
-            error_class=NotImplementedError,
-            error_regex=r"non-value",
-        ),
         dict(
             testcase_name="datatype_not_time",
             snak={"snaktype": "value", "datatype": "string"},
@@ -261,77 +298,28 @@ class WikidataValueTest(parameterized.TestCase):
         ),
         dict(
             testcase_name="not_gregorian",
-            snak={
-                "snaktype": "value",
-                "datatype": "time",
-                "datavalue": {
-                    "type": "time",
-                    "value": {
-                        "calendarmodel": "http://www.wikidata.org/entity/Q1",
-                    },
-                },
-            },
+            snak=_snak_time(
+                "+1979-10-12T00:00:00Z",
+                calendarmodel="http://www.wikidata.org/entity/Q1",
+            ),
             error_class=NotImplementedError,
             error_regex=r"non-Gregorian",
         ),
         dict(
             testcase_name="not_utc",
-            snak={
-                "snaktype": "value",
-                "datatype": "time",
-                "datavalue": {
-                    "type": "time",
-                    "value": {
-                        "calendarmodel": (
-                            wikidata_value.Q_PROLEPTIC_GREGORIAN_CALENDAR.uri
-                        ),
-                        "timezone": 42,
-                    },
-                },
-            },
+            snak=_snak_time("+1979-10-12T00:00:00Z", timezone=42),
             error_class=NotImplementedError,
             error_regex=r"non-UTC",
         ),
         dict(
             testcase_name="unimplemented_precision",
-            snak={
-                "snaktype": "value",
-                "datatype": "time",
-                "datavalue": {
-                    "type": "time",
-                    "value": {
-                        "calendarmodel": (
-                            wikidata_value.Q_PROLEPTIC_GREGORIAN_CALENDAR.uri
-                        ),
-                        "timezone": 0,
-                        "before": 0,
-                        "after": 0,
-                        "precision": 0,
-                    },
-                },
-            },
+            snak=_snak_time("+1979-10-12T00:00:00Z", precision=0),
             error_class=NotImplementedError,
             error_regex=r"precision",
         ),
         dict(
             testcase_name="no_match",
-            snak={
-                "snaktype": "value",
-                "datatype": "time",
-                "datavalue": {
-                    "type": "time",
-                    "value": {
-                        "calendarmodel": (
-                            wikidata_value.Q_PROLEPTIC_GREGORIAN_CALENDAR.uri
-                        ),
-                        "timezone": 0,
-                        "before": 0,
-                        "after": 0,
-                        "precision": 11,
-                        "time": "foo",
-                    },
-                },
-            },
+            snak=_snak_time("foo"),
             error_class=ValueError,
             error_regex=r"Cannot parse time",
         ),
@@ -343,8 +331,25 @@ class WikidataValueTest(parameterized.TestCase):
         error_class: type[Exception],
         error_regex: str,
     ) -> None:
+        parsed_snak = wikidata_value.Snak(json=snak)
         with self.assertRaisesRegex(error_class, error_regex):
-            wikidata_value.Snak(json=snak).time_value()
+            parsed_snak.time_value()
+
+    @parameterized.parameters(
+        "",
+        "-1979-10-12T00:00:00Z",
+        "+19790-10-12T00:00:00Z",
+        "+ 979-10-12T00:00:00Z",
+        "+1979-+1-12T00:00:00Z",
+        "+1979-10-1٢T00:00:00Z",
+        "+1979-10-12 00:00:00Z",
+        "+1979-10-12T00:00:00",
+        "+1979-10-12T00:00:00Z0",
+    )
+    def test_snak_time_value_invalid_time(self, time: str) -> None:
+        snak = wikidata_value.Snak(json=_snak_time(time))
+        with self.assertRaisesRegex(ValueError, "Cannot parse time"):
+            snak.time_value()
 
     @parameterized.parameters(
         (
@@ -409,14 +414,16 @@ class WikidataValueTest(parameterized.TestCase):
         self,
         statement: Any,
         property_id: str,
-        expected_qualifiers: Collection[Any],
+        expected_qualifiers: Sequence[Any],
     ) -> None:
-        self.assertCountEqual(
+        self.assertEqual(
             tuple(
                 wikidata_value.Snak(json=snak) for snak in expected_qualifiers
             ),
-            wikidata_value.Statement(json=statement).qualifiers(
-                wikidata_value.PropertyRef(property_id)
+            tuple(
+                wikidata_value.Statement(json=statement).qualifiers(
+                    wikidata_value.PropertyRef(property_id)
+                )
             ),
         )
 
@@ -454,8 +461,9 @@ class WikidataValueTest(parameterized.TestCase):
         error_class: type[Exception],
         error_regex: str,
     ) -> None:
+        parsed_statement = wikidata_value.Statement(json=statement)
         with self.assertRaisesRegex(error_class, error_regex):
-            wikidata_value.Statement(json=statement).time_value()
+            parsed_statement.time_value()
 
     @parameterized.parameters(
         (
@@ -525,6 +533,23 @@ class WikidataValueTest(parameterized.TestCase):
                 languages=("en",),
                 expected_value="foo",
             ),
+            dict(
+                mapping={
+                    "en-us": {"value": "foo"},
+                    "en-gb": {"value": "bar"},
+                    "fr": {"value": "baz"},
+                },
+                languages=("en", "fr"),
+                expected_value="foo",
+            ),
+            dict(
+                mapping={
+                    "zh": {"value": "foo"},
+                    "zh-hant-tw": {"value": "bar"},
+                },
+                languages=("zh-hant", "zh"),
+                expected_value="bar",
+            ),
         ),
     )
     def test_language_keyed_string(
@@ -616,12 +641,14 @@ class WikidataValueTest(parameterized.TestCase):
         prop: wikidata_value.PropertyRef,
         statements: Sequence[Any],
     ) -> None:
-        self.assertCountEqual(
+        self.assertEqual(
             tuple(
                 wikidata_value.Statement(json=statement)
                 for statement in statements
             ),
-            wikidata_value.Entity(json_full=entity).truthy_statements(prop),
+            tuple(
+                wikidata_value.Entity(json_full=entity).truthy_statements(prop)
+            ),
         )
 
     def test_parse_sparql_term_item_error(self) -> None: